@@ -22,6 +22,7 @@ import json
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from re import Match, Pattern
 from typing import (
     Any,
@@ -56,7 +57,7 @@ from sqlalchemy.types import TypeEngine
 from sqlparse.tokens import CTE
 
 from superset import security_manager, sql_parse
-from superset.constants import TimeGrain as TimeGrainConstants
+from superset.constants import LRU_CACHE_MAX_SIZE, TimeGrain as TimeGrainConstants
 from superset.databases.utils import make_url_safe
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.sql_parse import ParsedQuery, Table
@@ -726,15 +727,40 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
         :return: All time grain expressions supported by the engine
         """
-        # TODO: use @memoize decorator or similar to avoid recomputation on every call
-        time_grain_expressions = cls._time_grain_expressions.copy()
         grain_addon_expressions = current_app.config["TIME_GRAIN_ADDON_EXPRESSIONS"]
-        time_grain_expressions.update(grain_addon_expressions.get(cls.engine, {}))
         denylist: list[str] = current_app.config["TIME_GRAIN_DENYLIST"]
+        return dict(
+            cls._sorted_time_grain_expressions(
+                tuple(grain_addon_expressions.get(cls.engine, {}).items()),
+                tuple(denylist),
+            )
+        )
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _sorted_time_grain_expressions(
+        cls,
+        grain_addon_expressions: tuple[tuple[str, str], ...],
+        denylist: tuple[str, ...],
+    ) -> tuple[tuple[str | None, str], ...]:
+        """
+        Merge, filter and sort the time grain expressions.
+
+        Sorting is expensive as each grain is matched against a regular
+        expression, so the result is memoized; the config values are passed in
+        as hashable tuples so that runtime config changes are still honored.
+
+        :param grain_addon_expressions: `TIME_GRAIN_ADDON_EXPRESSIONS` items
+            for the engine
+        :param denylist: The `TIME_GRAIN_DENYLIST` config
+        :return: The sorted time grain expression items
+        """
+        time_grain_expressions = cls._time_grain_expressions.copy()
+        time_grain_expressions.update(grain_addon_expressions)
         for key in denylist:
             time_grain_expressions.pop(key, None)
 
-        return dict(
+        return tuple(
             sorted(
                 time_grain_expressions.items(),
                 key=lambda x: (
@@ -24,9 +24,10 @@ import time
 from abc import ABCMeta
 from collections import defaultdict, deque
 from datetime import datetime
+from functools import lru_cache
 from re import Pattern
 from textwrap import dedent
-from typing import Any, cast, Optional, TYPE_CHECKING
+from typing import Any, Callable, cast, Optional, TYPE_CHECKING
 from urllib import parse
 
 import pandas as pd
@@ -43,7 +44,7 @@ from sqlalchemy.sql.expression import ColumnClause, Select
 
 from superset import cache_manager, db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
-from superset.constants import TimeGrain
+from superset.constants import LRU_CACHE_MAX_SIZE, TimeGrain
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import SupersetErrorType
@@ -95,6 +96,17 @@ CONNECTION_UNKNOWN_DATABASE_ERROR = re.compile(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def _quote_schema(schema: str) -> str:
+    """
+    URL-quote the given schema name.
+
+    Schema names are drawn from a small set but quoted on every request, so
+    the result is memoized.
+    """
+    return parse.quote(schema, safe="")
+
+
 def get_children(column: ResultSetColumnType) -> list[ResultSetColumnType]:
     """
     Get the children of a complex Presto type (row or array).
@@ -268,6 +280,53 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         TimeGrain.WEEK_ENDING_SUNDAY: "date_trunc('week', CAST({col} AS TIMESTAMP)) + interval '6' day",  # noqa
     }
 
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _cached_sqla_column_type(cls, target_type: str) -> types.TypeEngine | None:
+        """
+        Resolve and memoize the SQLAlchemy type for the given native type.
+
+        Type resolution matches the native type against a list of regular
+        expressions, which is needless repeated work when literals are
+        converted for the same handful of column types on every query.
+
+        :param target_type: Native database type
+        :return: The SQLAlchemy column type, if known
+        """
+        return cls.get_sqla_column_type(target_type)
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _dttm_formatter(cls, target_type: str) -> Callable[[datetime], str] | None:
+        """
+        Build and memoize a literal formatter specialized for the given type.
+
+        Resolving the type and choosing the literal format once per target
+        type leaves a single cache lookup and call on the conversion path.
+
+        :param target_type: Native database type
+        :return: A formatter producing the SQL literal, if the type is temporal
+        """
+        sqla_type = cls._cached_sqla_column_type(target_type)
+
+        if isinstance(sqla_type, types.Date):
+            # format directly rather than via dttm.date().isoformat() to avoid
+            # allocating an intermediate date object per conversion
+            def format_date(dttm: datetime) -> str:
+                return f"DATE '{dttm.year:04d}-{dttm.month:02d}-{dttm.day:02d}'"
+
+            return format_date
+
+        if isinstance(sqla_type, types.TIMESTAMP):
+
+            def format_timestamp(dttm: datetime) -> str:
+                timestamp = dttm.isoformat(timespec="microseconds", sep=" ")
+                return f"TIMESTAMP '{timestamp}'"
+
+            return format_timestamp
+
+        return None
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -281,12 +340,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         Superset only defines time zone naive `datetime` objects, though this method
         handles both time zone naive and aware conversions.
         """
-        sqla_type = cls.get_sqla_column_type(target_type)
-
-        if isinstance(sqla_type, types.Date):
-            return f"DATE '{dttm.date().isoformat()}'"
-        if isinstance(sqla_type, types.TIMESTAMP):
-            return f"""TIMESTAMP '{dttm.isoformat(timespec="microseconds", sep=" ")}'"""
+        if formatter := cls._dttm_formatter(target_type):
+            return formatter(dttm)
 
         return None
 
@@ -304,12 +359,10 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     ) -> tuple[URL, dict[str, Any]]:
         database = uri.database
         if schema and database:
-            schema = parse.quote(schema, safe="")
-            if "/" in database:
-                database = database.split("/")[0] + "/" + schema
-            else:
-                database += "/" + schema
-            uri = uri.set(database=database)
+            catalog, _, current_schema = database.partition("/")
+            # rebuilding the URI is only needed when the schema changes
+            if parse.unquote(current_schema) != schema:
+                uri = uri.set(database=f"{catalog}/{_quote_schema(schema)}")
 
         return uri, connect_args
 
@@ -812,6 +812,10 @@ class Database(
 
     # pylint: disable=invalid-name
     def update_params_from_encrypted_extra(self, params: dict[str, Any]) -> None:
+        # all engine spec implementations no-op when `encrypted_extra` is
+        # empty, which is the common case, so skip the dispatch entirely
+        if not self.encrypted_extra:
+            return
         self.db_engine_spec.update_params_from_encrypted_extra(self, params)
 
     def get_table(self, table_name: str, schema: str | None = None) -> Table:
@@ -523,6 +523,95 @@ def test_get_columns_expand_rows(mocker: MockerFixture):
     _assert_columns_equal(actual, expected)
 
 
+def test_get_table_names(mocker: MockerFixture) -> None:
+    """Test that table names are fetched with a single qmark-style query"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    database = mocker.MagicMock()
+    conn = database.get_raw_connection.return_value.__enter__.return_value
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        ("table1", "BASE TABLE"),
+        ("table2", "BASE TABLE"),
+        ("view1", "VIEW"),
+    ]
+
+    result = TrinoEngineSpec.get_table_names(database, mocker.Mock(), "schema1")
+    assert result == {"table1", "table2"}
+
+    sql, params = cursor.execute.call_args[0]
+    # the trino DBAPI uses the qmark paramstyle and asserts that params
+    # is a list or tuple
+    assert "= ?" in sql
+    assert params == ("schema1",)
+
+
+def test_get_view_names(mocker: MockerFixture) -> None:
+    """Test that view names are fetched with a single qmark-style query"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    database = mocker.MagicMock()
+    conn = database.get_raw_connection.return_value.__enter__.return_value
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        ("table1", "BASE TABLE"),
+        ("view1", "VIEW"),
+        ("view2", "VIEW"),
+    ]
+
+    result = TrinoEngineSpec.get_view_names(database, mocker.Mock(), "schema1")
+    assert result == {"view1", "view2"}
+
+    sql, params = cursor.execute.call_args[0]
+    assert "= ?" in sql
+    assert params == ("schema1",)
+
+
+def test_get_table_and_view_names_shared_fetch(mocker: MockerFixture) -> None:
+    """Test that back-to-back table/view listings share a single query"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    database = mocker.MagicMock()
+    conn = database.get_raw_connection.return_value.__enter__.return_value
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        ("table1", "BASE TABLE"),
+        ("view1", "VIEW"),
+    ]
+
+    tables = TrinoEngineSpec.get_table_names(database, mocker.Mock(), "schema1")
+    views = TrinoEngineSpec.get_view_names(database, mocker.Mock(), "schema1")
+    assert tables == {"table1"}
+    assert views == {"view1"}
+    cursor.execute.assert_called_once()
+
+
+def test_get_table_names_no_schema(mocker: MockerFixture) -> None:
+    """Test that the inspector-based listing is used when schema is omitted"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    database = mocker.MagicMock()
+    inspector = mocker.Mock()
+    inspector.get_table_names.return_value = ["table1", "table2"]
+
+    result = TrinoEngineSpec.get_table_names(database, inspector, None)
+    assert result == {"table1", "table2"}
+    database.get_raw_connection.assert_not_called()
+
+
+def test_get_view_names_no_schema(mocker: MockerFixture) -> None:
+    """Test that the inspector-based listing is used when schema is omitted"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    database = mocker.MagicMock()
+    inspector = mocker.Mock()
+    inspector.get_view_names.return_value = ["view1"]
+
+    result = TrinoEngineSpec.get_view_names(database, inspector, None)
+    assert result == {"view1"}
+    database.get_raw_connection.assert_not_called()
+
+
 def test_get_indexes_no_table():
     from sqlalchemy.exc import NoSuchTableError
 